@@ -0,0 +1,58 @@
+import os
+import sys
+import tempfile
+
+# Checks that charts served from the derived cache match the ones built on a
+# cache miss. Sankey link tables are the case that broke before: endpoint
+# dtypes (numeric, categorical, text) must survive the parquet round-trip.
+#
+# Usage: python cacheroundtripcheck.py
+
+import pandas as pd
+
+import derivedcache
+from charts import CHART_REGISTRY
+from chartplanner import plan_chart
+
+SANKEY_CASES = {
+    "numeric endpoints": pd.DataFrame({"s": [1, 2], "t": [3, 1], "v": [5, 7]}),
+    "float endpoints with a gap": pd.DataFrame({"s": [1.5, None, 2.0], "t": [2.0, 1.5, 3.0], "v": [1, 2, 3]}),
+    "categorical numeric endpoints": pd.DataFrame({
+        "s": pd.Categorical([1, 1, 2]), "t": pd.Categorical([2, 3, 3]), "v": [1, 2, 3],
+    }),
+    "categorical text endpoints": pd.DataFrame({
+        "s": pd.Categorical(["Mild", "Mild", "Severe"]), "t": pd.Categorical(["x", "y", "x"]), "v": [1, 2, 3],
+    }),
+    "text endpoints": pd.DataFrame({"s": ["a", "b", "a"], "t": ["b", "c", "c"], "v": [1, 2, 3]}),
+}
+
+
+def sankey_figure(df, dataset_key):
+    spec = CHART_REGISTRY["Sankey Diagram"]
+    selection = {"source": "s", "target": "t", "value": "v"}
+    return spec.build(plan_chart(spec, df, selection, dataset_key), selection)
+
+
+def main():
+    derivedcache.CACHE_DIR = tempfile.mkdtemp(prefix="derived_cache_check_")
+    status = 0
+    for name, df in SANKEY_CASES.items():
+        before = len(os.listdir(derivedcache.CACHE_DIR))
+        miss = sankey_figure(df, name)
+        if len(os.listdir(derivedcache.CACHE_DIR)) == before:
+            print(f"FAIL: {name}: link table was not written to the cache")
+            status = 1
+            continue
+        hit = sankey_figure(df, name)
+        node, link = hit.data[0].node, hit.data[0].link
+        if miss.to_json() != hit.to_json():
+            print(f"FAIL: {name}: cache hit differs from cache miss")
+            status = 1
+        else:
+            links = [(int(s), int(t)) for s, t in zip(link.source, link.target)]
+            print(f"OK: {name}: nodes {list(node.label)}, links {links}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
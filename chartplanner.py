@@ -0,0 +1,177 @@
+from dataclasses import dataclass
+
+import streamlit as st
+
+from charts import CHART_REGISTRY
+from derivedcache import cached_frame
+
+# Planner for registered charts: turns a ChartSpec plus the user's column
+# choices into the frame its builder needs. Projection, numeric coercion,
+# aggregation and downsampling live here once instead of in every chart.
+
+# Point-per-row charts are thinned to at most this many rows
+MAX_POINTS = 5000
+
+# Rows sampled when deciding whether a text column holds numbers
+NUMERIC_SAMPLE = 100
+
+
+@dataclass
+class ColumnMeta:
+    columns: list
+    numeric_columns: list
+    # column name -> True for columns usable as numbers (directly or after
+    # coercion); dict lookups keep option validation O(1) per role
+    numeric: dict
+
+
+def _looks_numeric(values):
+    import pandas as pd
+    sample = values.dropna().head(NUMERIC_SAMPLE)
+    return len(sample) > 0 and pd.to_numeric(sample, errors='coerce').notna().all()
+
+
+@st.cache_data(show_spinner=False)
+def column_metadata(dataset_key, _df):
+    # Classify every column once per dataset: Streamlit caches the result on
+    # the file digest, so widget reruns reuse it without hashing the frame.
+    # Categoricals are judged on their categories, so this never touches
+    # per-row labels.
+    df = _df
+    import pandas as pd
+    numeric = {}
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_bool_dtype(series):
+            numeric[column] = False
+        elif pd.api.types.is_numeric_dtype(series):
+            numeric[column] = True
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            numeric[column] = bool(_looks_numeric(pd.Series(series.cat.categories)))
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            numeric[column] = bool(_looks_numeric(series))
+        else:
+            numeric[column] = False
+    return ColumnMeta(
+        columns=list(df.columns),
+        numeric_columns=[column for column in df.columns if numeric[column]],
+        numeric=numeric,
+    )
+
+
+def select_roles(spec, meta):
+    # One widget per role; numeric roles only offer numeric columns
+    selection = {}
+    for role in spec.roles:
+        options = meta.numeric_columns if role.numeric else meta.columns
+        if role.multiple:
+            selection[role.name] = st.multiselect(role.label, options)
+        else:
+            selection[role.name] = st.selectbox(role.label, options)
+    return selection
+
+
+def validate_selection(spec, selection, meta):
+    # Returns an error message, or None when every role is satisfied
+    for role in spec.roles:
+        chosen = selection.get(role.name)
+        columns = chosen if role.multiple else [chosen]
+        if chosen is None or not columns:
+            return f"{spec.name} needs a column for {role.label}"
+        for column in columns:
+            if column not in meta.numeric:
+                return f"Unknown column {column!r} for {role.label}"
+            if role.numeric and not meta.numeric[column]:
+                return f"{role.label} needs a numeric column, {column!r} is not numeric"
+    # A grouping column cannot also be the measure being aggregated
+    keys = {selection[name] for name in spec.group_by}
+    for role in spec.roles:
+        if role.numeric and role.name not in spec.group_by and not role.multiple and selection[role.name] in keys:
+            return f"{role.label} must be a different column from the grouping column"
+    return None
+
+
+def _to_numeric(series):
+    import numpy as np
+    import pandas as pd
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Coerce the categories once and index them with the codes
+        categories = pd.to_numeric(pd.Series(series.cat.categories), errors='coerce').to_numpy(dtype=float)
+        codes = series.cat.codes.to_numpy()
+        values = np.where(codes >= 0, categories[codes.clip(min=0)], np.nan)
+        return pd.Series(values, index=series.index, name=series.name)
+    return pd.to_numeric(series, errors='coerce')
+
+
+def _role_columns(spec, selection, numeric_only=None):
+    columns = []
+    for role in spec.roles:
+        if numeric_only is not None and role.numeric != numeric_only:
+            continue
+        chosen = selection[role.name]
+        for column in (chosen if role.multiple else [chosen]):
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+def _plan(spec, df, selection):
+    if not spec.roles:
+        return df
+
+    # Projection: only the selected columns go any further
+    data = df[_role_columns(spec, selection)].copy()
+
+    # Type coercion for numeric roles
+    for column in _role_columns(spec, selection, numeric_only=True):
+        data[column] = _to_numeric(data[column])
+
+    # Aggregation on the (categorical) group keys
+    if spec.aggregate:
+        keys = [selection[name] for name in spec.group_by]
+        measures = [column for column in _role_columns(spec, selection, numeric_only=True) if column not in keys]
+        if keys:
+            data = data.groupby(keys, observed=True, sort=False, as_index=False)[measures].agg(spec.aggregate)
+        else:
+            data = data[measures].agg(spec.aggregate).to_frame().T
+
+    if spec.prepare:
+        data = spec.prepare(data, selection)
+
+    # Downsampling by stride keeps the first row and the overall shape
+    if spec.downsample and len(data) > MAX_POINTS:
+        step = -(-len(data) // MAX_POINTS)
+        data = data.iloc[::step]
+
+    return data
+
+
+def plan_chart(spec, df, selection, dataset_key):
+    # Aggregated or prepared results are small and worth keeping in the
+    # derived cache; plain projections are recomputed
+    if spec.aggregate or spec.prepare:
+        return cached_frame(dataset_key, "chart:" + spec.name, selection, lambda: _plan(spec, df, selection))
+    return _plan(spec, df, selection)
+
+
+def render_chart(visualization_type, df, dataset_key, meta):
+    spec = CHART_REGISTRY[visualization_type]
+    selection = select_roles(spec, meta)
+    error = validate_selection(spec, selection, meta)
+    if error:
+        st.info(error)
+        return
+
+    data = plan_chart(spec, df, selection, dataset_key)
+    if spec.downsample and len(df) > MAX_POINTS:
+        st.caption(f"Chart is sampled: {len(df):,} rows thinned to at most {MAX_POINTS:,} points, "
+                   "so single peaks may not show.")
+    result = spec.build(data, selection)
+    if spec.output == "metric":
+        st.metric(**result)
+    elif spec.output == "table":
+        st.table(result)
+    else:
+        st.plotly_chart(result)
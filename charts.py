@@ -0,0 +1,250 @@
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+# Declarative chart registry. Each ChartSpec names the column roles it needs,
+# how its data is aggregated and how the figure is built; chartplanner.py does
+# the shared work (projection, type coercion, aggregation, downsampling) once
+# before calling build(). Builders import the plotly modules they need on
+# first use, so picking a chart type is the first point at which plotly loads.
+
+
+@dataclass(frozen=True)
+class Role:
+    name: str
+    label: str
+    numeric: bool = False
+    multiple: bool = False
+
+
+@dataclass(frozen=True)
+class ChartSpec:
+    name: str
+    roles: tuple
+    build: Callable
+    # "plotly" -> build returns a figure, "metric" -> st.metric kwargs,
+    # "table" -> a frame for st.table
+    output: str = "plotly"
+    # aggregate numeric roles with this function, grouped by group_by roles
+    aggregate: Optional[str] = None
+    group_by: tuple = ()
+    # chart-specific prep run after aggregation, before build
+    prepare: Optional[Callable] = None
+    # thin point-per-row charts down to chartplanner.MAX_POINTS rows
+    downsample: bool = False
+
+
+# Basic charts
+def build_bar(barmode="relative"):
+    def build(data, cols):
+        import plotly.express as px
+        return px.bar(data, x=cols["x"], y=cols["y"], color=cols.get("color"), barmode=barmode)
+    return build
+
+
+def build_line(data, cols):
+    import plotly.express as px
+    return px.line(data, x=cols["x"], y=cols["y"])
+
+
+def build_stacked_line(data, cols):
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    for y in cols["y"]:
+        fig.add_trace(go.Scatter(x=data[cols["x"]], y=data[y], stackgroup='one', name=y))
+    return fig
+
+
+def build_area(data, cols):
+    import plotly.express as px
+    return px.area(data, x=cols["x"], y=cols["y"])
+
+
+def build_pie(hole=None):
+    def build(data, cols):
+        import plotly.express as px
+        return px.pie(data, values=cols["values"], names=cols["names"], hole=hole)
+    return build
+
+
+def build_scatter(data, cols):
+    import plotly.express as px
+    return px.scatter(data, x=cols["x"], y=cols["y"], size=cols.get("size"))
+
+
+# Specialized charts
+def build_line_with_clustered_column(data, cols):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    x, y1, y2 = cols["x"], cols["y_bar"], cols["y_line"]
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(go.Bar(x=data[x], y=data[y1], name=y1), secondary_y=False)
+    fig.add_trace(go.Scatter(x=data[x], y=data[y2], name=y2), secondary_y=True)
+    return fig
+
+
+def build_treemap(data, cols):
+    import plotly.express as px
+    return px.treemap(data, path=[cols["path"]], values=cols["values"])
+
+
+def build_sunburst(data, cols):
+    import plotly.express as px
+    return px.sunburst(data, path=[cols["path"]], values=cols["values"])
+
+
+def build_waterfall(data, cols):
+    import plotly.graph_objects as go
+    return go.Figure(go.Waterfall(x=data[cols["x"]], y=data[cols["y"]]))
+
+
+def build_funnel(data, cols):
+    import plotly.express as px
+    return px.funnel(data, x=cols["values"], y=cols["stage"])
+
+
+def build_gauge(data, cols):
+    import plotly.graph_objects as go
+    return go.Figure(go.Indicator(mode="gauge+number", value=data[cols["value"]].iloc[0]))
+
+
+def build_box(data, cols):
+    import plotly.express as px
+    return px.box(data, x=cols["x"], y=cols["y"])
+
+
+def build_histogram(data, cols):
+    import plotly.express as px
+    return px.histogram(data, x=cols["x"])
+
+
+def build_ribbon(data, cols):
+    import plotly.graph_objects as go
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=data[cols["x"]], y=data[cols["y_lower"]], mode='lines', line_color='blue'))
+    fig.add_trace(go.Scatter(x=data[cols["x"]], y=data[cols["y_upper"]], fill='tonexty', mode='lines', line_color='lightblue'))
+    return fig
+
+
+def prepare_sankey(data, cols):
+    # Link table with integer node ids plus the label of each endpoint, as
+    # plain columns so it survives the parquet round-trip of the derived
+    # cache unchanged. One factorize over both endpoint columns gives node
+    # ids in order of first appearance; categorical endpoints are unioned
+    # first so the factorize runs on their integer codes.
+    import numpy as np
+    import pandas as pd
+    source_column, target_column = data[cols["source"]], data[cols["target"]]
+    keep = source_column.notna() & target_column.notna()
+    endpoints = [source_column[keep], target_column[keep]]
+    if all(isinstance(s.dtype, pd.CategoricalDtype) for s in endpoints):
+        combined = pd.api.types.union_categoricals(endpoints)
+    else:
+        combined = pd.concat(endpoints)
+    codes, labels = pd.factorize(combined)
+    labels = np.asarray(labels, dtype=object)
+    source, target = codes[:int(keep.sum())], codes[int(keep.sum()):]
+    return pd.DataFrame({
+        "source": source,
+        "target": target,
+        "value": data[cols["value"]].to_numpy()[keep.to_numpy()],
+        "source_label": labels[source],
+        "target_label": labels[target],
+    })
+
+
+def build_sankey(data, cols):
+    # Node labels are rebuilt from the per-link endpoint labels: node id i
+    # gets the label stored next to any link that uses it
+    import numpy as np
+    import plotly.graph_objects as go
+    codes = np.concatenate([data["source"].to_numpy(), data["target"].to_numpy()])
+    endpoint_labels = np.concatenate([data["source_label"].to_numpy(dtype=object),
+                                      data["target_label"].to_numpy(dtype=object)])
+    labels = np.empty(codes.max() + 1 if len(codes) else 0, dtype=object)
+    labels[codes] = endpoint_labels
+    link = dict(source=data["source"], target=data["target"], value=data["value"])
+    return go.Figure(data=[go.Sankey(node=dict(label=labels.tolist()), link=link)])
+
+
+def build_radar(data, cols):
+    import plotly.express as px
+    mean_values = data[cols["y"]].iloc[0]
+    return px.line_polar(r=mean_values.values, theta=cols["y"], line_close=True)
+
+
+# Data presentation
+def build_table(data, cols):
+    return data
+
+
+def build_metric(label):
+    def build(data, cols):
+        return dict(label=label.format(column=cols["column"]), value=data[cols["column"]].iloc[0])
+    return build
+
+
+# Maps
+def build_choropleth(data, cols):
+    import plotly.express as px
+    return px.choropleth(data, locations=cols["location"], color=cols["color"])
+
+
+def build_bubble_map(data, cols):
+    import plotly.express as px
+    return px.scatter_geo(data, lat=cols["lat"], lon=cols["lon"], size=cols["size"])
+
+
+X = Role("x", "X-Axis")
+Y = Role("y", "Y-Axis", numeric=True)
+Y_MULTIPLE = Role("y", "Y-Axis (Select multiple)", numeric=True, multiple=True)
+COLOR = Role("color", "Color By")
+
+CHART_SPECS = [
+    ChartSpec("Simple Bar", (X, Y), build_bar()),
+    ChartSpec("Stacked Bar", (X, Y, COLOR), build_bar('stack')),
+    ChartSpec("Clustered Bar", (X, Y, COLOR), build_bar('group')),
+    ChartSpec("Line Chart", (X, Y), build_line, downsample=True),
+    ChartSpec("Stacked Line", (X, Y_MULTIPLE), build_stacked_line, downsample=True),
+    ChartSpec("Area Chart", (X, Y), build_area, downsample=True),
+    ChartSpec("Pie Chart", (Role("values", "Values", numeric=True), Role("names", "Names")),
+              build_pie(), aggregate="sum", group_by=("names",)),
+    ChartSpec("Donut Chart", (Role("values", "Values", numeric=True), Role("names", "Names")),
+              build_pie(0.4), aggregate="sum", group_by=("names",)),
+    ChartSpec("Scatter Plot", (X, Y), build_scatter, downsample=True),
+    ChartSpec("Bubble Chart", (X, Y, Role("size", "Size Column", numeric=True)), build_scatter, downsample=True),
+    ChartSpec("Line with Clustered Column",
+              (X, Role("y_bar", "Y-Axis (Bar)", numeric=True), Role("y_line", "Y-Axis (Line)", numeric=True)),
+              build_line_with_clustered_column),
+    ChartSpec("Treemap", (Role("path", "Path"), Role("values", "Values", numeric=True)),
+              build_treemap, aggregate="sum", group_by=("path",)),
+    ChartSpec("Waterfall", (X, Y), build_waterfall),
+    ChartSpec("Funnel", (Role("stage", "Stage"), Role("values", "Values", numeric=True)),
+              build_funnel, aggregate="sum", group_by=("stage",)),
+    ChartSpec("Gauge Chart", (Role("value", "Select Column", numeric=True),), build_gauge, aggregate="mean"),
+    ChartSpec("Box Plot", (X, Y), build_box),
+    ChartSpec("Histogram", (X,), build_histogram),
+    ChartSpec("Ribbon Chart",
+              (Role("x", "X-Axis", numeric=True), Role("y_lower", "Y1 (Lower Bound)", numeric=True),
+               Role("y_upper", "Y2 (Upper Bound)", numeric=True)),
+              build_ribbon, downsample=True),
+    ChartSpec("Sankey Diagram",
+              (Role("source", "Source"), Role("target", "Target"), Role("value", "Value", numeric=True)),
+              build_sankey, prepare=prepare_sankey),
+    ChartSpec("Radar Chart", (Y_MULTIPLE,), build_radar, aggregate="mean"),
+    ChartSpec("Sunburst", (Role("path", "Hierarchy Path"), Role("values", "Values", numeric=True)),
+              build_sunburst, aggregate="sum", group_by=("path",)),
+    ChartSpec("Basic Table", (), build_table, output="table"),
+    ChartSpec("Single Number Card", (Role("column", "Select Column", numeric=True),),
+              build_metric("Total {column}"), output="metric", aggregate="sum"),
+    ChartSpec("KPI", (Role("column", "Select Column for KPI", numeric=True),),
+              build_metric("KPI of {column}"), output="metric", aggregate="sum"),
+    ChartSpec("Choropleth Map", (Role("location", "Location"), Role("color", "Color", numeric=True)), build_choropleth),
+    ChartSpec("Bubble Map",
+              (Role("lat", "Latitude", numeric=True), Role("lon", "Longitude", numeric=True),
+               Role("size", "Size", numeric=True)),
+              build_bubble_map, downsample=True),
+]
+
+CHART_REGISTRY = {spec.name: spec for spec in CHART_SPECS}
+
+CHART_TYPES = list(CHART_REGISTRY)
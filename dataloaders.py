@@ -0,0 +1,73 @@
+import streamlit as st
+
+from derivedcache import cached_frame
+
+# Format loaders are imported on first use so the upload widget renders
+# without paying for pandas, openpyxl or the XML parser up front.
+
+
+def load_excel(uploaded_file):
+    import pandas as pd  # pd.read_excel pulls in openpyxl itself
+    return pd.read_excel(uploaded_file)
+
+
+def load_csv(uploaded_file):
+    import pandas as pd
+    return pd.read_csv(uploaded_file)
+
+
+def load_json(uploaded_file):
+    import json
+    import pandas as pd
+    data = json.load(uploaded_file)
+    return pd.json_normalize(data)
+
+
+def load_xml(uploaded_file):
+    import xml.etree.ElementTree as ET
+    import pandas as pd
+    tree = ET.parse(uploaded_file)
+    root = tree.getroot()
+    xml_data = [{child.tag: child.text for child in elem} for elem in root]
+    return pd.DataFrame(xml_data)
+
+
+LOADERS = {
+    '.xlsx': load_excel,
+    '.csv': load_csv,
+    '.json': load_json,
+    '.xml': load_xml,
+}
+
+UPLOAD_TYPES = [extension.lstrip('.') for extension in LOADERS]
+
+# Text columns with at most this share of distinct values are stored as
+# pandas categoricals: one small label array plus integer codes per row.
+CATEGORY_MAX_RATIO = 0.5
+
+
+def encode_text_columns(df):
+    # Dictionary-encode repeated text columns at ingest so grouping, coloring
+    # and link building work on integer codes; labels are only looked up when
+    # a chart is rendered
+    for column in df.select_dtypes(include=['object', 'string']).columns:
+        try:
+            distinct = df[column].nunique(dropna=True)
+        except TypeError:  # unhashable values, e.g. lists from nested JSON
+            continue
+        if len(df) and distinct <= CATEGORY_MAX_RATIO * len(df):
+            df[column] = df[column].astype('category')
+    return df
+
+
+def load_dataframe(uploaded_file, dataset_key):
+    # Pick the loader from the file extension, as the upload widget only
+    # accepts the types listed in UPLOAD_TYPES. The parsed frame is kept in
+    # the derived cache (categoricals included) so a re-upload after a
+    # restart skips parsing and encoding.
+    for extension, loader in LOADERS.items():
+        if uploaded_file.name.endswith(extension):
+            return cached_frame(dataset_key, "load", {"format": extension},
+                                lambda: encode_text_columns(loader(uploaded_file)))
+    st.error(f"Unsupported file type: {uploaded_file.name}")
+    return None
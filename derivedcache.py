@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to atomic renames without a lock
+    fcntl = None
+
+# Persistent cache of derived artifacts (loaded frames, aggregates, link
+# tables). Entries are parquet files keyed by CACHE_VERSION, dataset hash,
+# operation and parameters, so they survive server restarts and are shared
+# by every server process pointed at the same directory.
+#
+# - writes go to a temp file and are os.replace()d into place, so readers
+#   never see a partial entry
+# - a hit bumps the file's mtime; eviction removes the least recently used
+#   entries until the directory is back under MAX_BYTES; temp files left by
+#   a crashed writer count towards the size and are removed once stale
+# - eviction runs under an exclusive flock on a lock file so two processes
+#   do not evict at once; a reader losing a race with eviction is a miss
+
+# Part of every cache key: bump it whenever a loader, aggregation or prepare
+# step changes what it produces, so entries from older code are not served
+CACHE_VERSION = 3
+
+CACHE_DIR = os.environ.get("DERIVED_CACHE_DIR", ".derived_cache")
+MAX_BYTES = int(os.environ.get("DERIVED_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+ENTRY_SUFFIX = ".parquet"
+TMP_SUFFIX = ".tmp"
+# Seconds after which a temp file is treated as abandoned
+TMP_MAX_AGE = 10 * 60
+LOCK_NAME = ".lock"
+
+
+def file_digest(uploaded_file):
+    # Dataset hash of an uploaded file, taken from its raw bytes
+    return hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+
+
+def cache_key(dataset_key, operation, params):
+    payload = json.dumps([CACHE_VERSION, dataset_key, operation, params], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _entry_path(key):
+    return os.path.join(CACHE_DIR, key + ENTRY_SUFFIX)
+
+
+@contextmanager
+def _exclusive_lock():
+    with open(os.path.join(CACHE_DIR, LOCK_NAME), "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read(path):
+    import pandas as pd
+    try:
+        df = pd.read_parquet(path)
+        os.utime(path)
+        return df
+    except Exception:
+        # missing (evicted), pyarrow missing or an unreadable entry: a miss
+        return None
+
+
+def _write(path, df):
+    # Any failure here (cache dir not creatable, read-only disk, pyarrow
+    # missing, a frame parquet cannot store) only skips caching; the caller
+    # still has the computed frame
+    tmp_path = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=TMP_SUFFIX)
+        os.close(fd)
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    return True
+
+
+def evict(max_bytes=None):
+    # Remove least recently used entries until the cache fits in max_bytes.
+    # Temp files count towards the size; ones older than TMP_MAX_AGE were
+    # left by a process that died mid-write and are removed.
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    if not os.path.isdir(CACHE_DIR):
+        return
+    with _exclusive_lock():
+        now = time.time()
+        entries = []
+        total = 0
+        for entry in os.scandir(CACHE_DIR):
+            is_entry = entry.name.endswith(ENTRY_SUFFIX)
+            if not is_entry and not entry.name.endswith(TMP_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if not is_entry and now - stat.st_mtime > TMP_MAX_AGE:
+                _remove(entry.path)
+                continue
+            total += stat.st_size
+            if is_entry:
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def cached_frame(dataset_key, operation, params, compute):
+    # Return the DataFrame produced by compute(), reading it from the
+    # persistent cache when this (dataset, operation, params) was seen before
+    path = _entry_path(cache_key(dataset_key, operation, params))
+    df = _read(path)
+    if df is not None:
+        return df
+    df = compute()
+    if _write(path, df):
+        evict()
+    return df
+
@@ -0,0 +1,95 @@
+import subprocess
+import sys
+
+# Cold-start benchmark for the app entry point. Runs visualizations6.py in a
+# fresh interpreter (streamlit bare mode, so no file is uploaded) and fails if
+# the entry script takes longer than the budget or if any lazily imported
+# module was loaded before the upload widget is shown.
+#
+# Only the entry script is timed: streamlit is imported first, outside the
+# timed window, because every worker pays for it whatever the app does.
+#
+# Usage: python startupbenchmark.py [entry_point] [budget_seconds]
+
+ENTRY_POINT = "visualizations6.py"
+RUNS = 5
+
+# Measured with streamlit 1.66.0, pandas 3.0.6, plotly 7.1.0 on Python 3.11
+# (best of 5 runs, entry script only, see regressiontestingdocumentation.py):
+#   baseline visualizations6.py (eager pandas/plotly imports): 0.443-0.454s
+#   thin entry point after the split:                          0.035-0.038s
+# The budget is about 4x the thin entry point and a third of the baseline,
+# so slower machines pass while a return of the eager imports still fails.
+BUDGET_SECONDS = 0.15
+
+LAZY_MODULES = [
+    "pandas", "plotly", "plotly.express", "plotly.graph_objects",
+    "plotly.subplots", "openpyxl", "lxml", "pdfplumber",
+    "sqlalchemy", "pymysql", "psycopg2",
+]
+
+# Guarded modules that streamlit itself imports, so the entry point cannot
+# avoid them. streamlit 1.66.0 registers its plotly theme at import time when
+# plotly is installed. Any other guarded module found loaded after
+# `import streamlit` fails the benchmark, since the eager check cannot see it.
+STREAMLIT_PRELOADS = ["plotly", "plotly.graph_objects"]
+
+PROBE = """
+import runpy, sys, time
+import streamlit
+preloaded = [m for m in {lazy_modules!r} if m in sys.modules]
+already_loaded = set(sys.modules)
+start = time.perf_counter()
+runpy.run_path({entry_point!r}, run_name="__main__")
+elapsed = time.perf_counter() - start
+eager = [m for m in {lazy_modules!r} if m in sys.modules and m not in already_loaded]
+print(streamlit.__version__)
+print(",".join(preloaded))
+print(elapsed)
+print(",".join(eager))
+"""
+
+
+def _split(line):
+    return [m for m in line.split(",") if m]
+
+
+def measure(entry_point):
+    probe = PROBE.format(entry_point=entry_point, lazy_modules=LAZY_MODULES)
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    version, preloaded, elapsed, eager = result.stdout.splitlines()[-4:]
+    return version, _split(preloaded), float(elapsed), _split(eager)
+
+
+def main():
+    entry_point = sys.argv[1] if len(sys.argv) > 1 else ENTRY_POINT
+    budget = float(sys.argv[2]) if len(sys.argv) > 2 else BUDGET_SECONDS
+
+    timings = []
+    for _ in range(RUNS):
+        version, preloaded, elapsed, eager = measure(entry_point)
+        timings.append(elapsed)
+    best = min(timings)
+
+    print(f"{entry_point}: best cold start {best:.3f}s over {RUNS} runs (budget {budget:.3f}s, streamlit {version})")
+    status = 0
+    known = [m for m in preloaded if m in STREAMLIT_PRELOADS]
+    unknown = [m for m in preloaded if m not in STREAMLIT_PRELOADS]
+    if known:
+        print(f"NOTE: imported by streamlit itself, not checked: {', '.join(known)}")
+    if unknown:
+        print(f"FAIL: streamlit {version} already imports {', '.join(unknown)}; the eager check cannot cover it")
+        status = 1
+    if eager:
+        print(f"FAIL: loaded before first upload: {', '.join(eager)}")
+        status = 1
+    if best > budget:
+        print("FAIL: cold start over budget")
+        status = 1
+    if status == 0:
+        print("OK")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())